@@ -0,0 +1,16 @@
+"""Locator helpers shared by the company-app page objects."""
+
+from __future__ import annotations
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+# Full resource-id prefix for the company app.
+RESOURCE_PREFIX = "com.cathayholdings.vdrf.ta:id"
+
+
+def rid(name: str) -> tuple[str, str]:
+    """Return an ``AppiumBy.ID`` locator for the app resource *name*.
+
+    ``rid("cta")`` → ``(AppiumBy.ID, "com.cathayholdings.vdrf.ta:id/cta")``
+    """
+    return (AppiumBy.ID, f"{RESOURCE_PREFIX}/{name}")
@@ -2,25 +2,98 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import logging
 import os
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from src.utils.config_loader import ConfigLoader
+from src.utils.waits import AdaptiveWait
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
 
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
 # Default timeout pulled from settings; fallback to 15s if not configured.
 _settings = ConfigLoader.load_settings()
-DEFAULT_TIMEOUT: int = _settings.get("timeouts", {}).get("explicit_wait", 15)
-SCREENSHOT_DIR: str = _settings.get("screenshots", {}).get("output_dir", "reports/screenshots")
+_timeouts = _settings.get("timeouts") or {}
+DEFAULT_TIMEOUT: float = _timeouts.get("explicit_wait", 15)
+SCREENSHOT_DIR: str = (_settings.get("screenshots") or {}).get("output_dir", "reports/screenshots")
+# UiAutomator2 session settings pushed once per Android driver.
+SESSION_SETTINGS: dict = (_settings.get("appium") or {}).get("settings", {})
+
+
+@dataclass(slots=True)
+class _DriverState:
+    """Per-session state shared by every page object wrapping the same driver."""
+
+    settings_applied: bool = False
+    keyboard_maybe_shown: bool = False
+    window_size: dict[str, int] | None = None
+
+
+# Keyed weakly so the state goes away with the driver.
+_driver_states: weakref.WeakKeyDictionary[WebDriver, _DriverState] = weakref.WeakKeyDictionary()
+
+# Screenshot PNGs are written to disk off the test thread.
+_SCREENSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+_pending_screenshots: weakref.WeakSet[Future] = weakref.WeakSet()
+_screenshot_errors: list[tuple[str, BaseException]] = []
+_screenshot_dir_ready = False
+# Run timestamp + per-process sequence number keep file names unique within a second.
+_SCREENSHOT_PREFIX = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
+_SCREENSHOT_SEQ = itertools.count()
+
+
+def queue_screenshot_write(file_path: str, png: bytes) -> None:
+    """Write *png* to *file_path* on the background screenshot writer.
+
+    Success is logged once the file is on disk; failures are collected and
+    reported by ``flush_screenshots``.
+    """
+    future = _SCREENSHOT_EXECUTOR.submit(Path(file_path).write_bytes, png)
+    future.add_done_callback(functools.partial(_on_screenshot_written, file_path))
+    _pending_screenshots.add(future)
+
+
+def _on_screenshot_written(file_path: str, future: Future) -> None:
+    """Done-callback for a screenshot write: log success or record the error."""
+    exc = future.exception()
+    if exc is None:
+        logger.info("Screenshot saved → %s", file_path)
+    else:
+        _screenshot_errors.append((file_path, exc))
+
+
+def flush_screenshots(timeout: float | None = None) -> None:
+    """Block until every queued screenshot is written, then log any write errors."""
+    _, not_done = wait(list(_pending_screenshots), timeout=timeout)
+    if not_done:
+        logger.warning("%d screenshot write(s) still pending after %ss", len(not_done), timeout)
+    while _screenshot_errors:
+        file_path, exc = _screenshot_errors.pop()
+        logger.warning("Failed to write screenshot %s", file_path, exc_info=exc)
 
 
 class BasePage:
@@ -28,63 +101,193 @@ class BasePage:
 
     Provides common helpers for finding elements, interacting with them,
     swiping, taking screenshots, and navigating.
+
+    Explicit waits poll with exponential backoff (10 ms, 20 ms, … capped at
+    ``timeouts.poll_frequency``) rather than Selenium's fixed 0.5s, so an
+    element that shows up quickly is returned almost at once.
     """
 
     def __init__(self, driver: WebDriver) -> None:
         self.driver = driver
+        self._waits: dict[float, AdaptiveWait] = {}
+        self._element_cache: dict[tuple[str, str], WebElement] = {}
+        self._state = _driver_states.setdefault(driver, _DriverState())
+        self._apply_session_settings()
+
+    def _apply_session_settings(self) -> None:
+        """Push ``appium.settings`` to an Android driver the first time any page wraps it.
+
+        The keys are UiAutomator2 settings (e.g. a shorter action
+        acknowledgment wait), so iOS sessions are left alone.  The call is
+        made once per driver; later pages skip it.
+        """
+        if self._state.settings_applied:
+            return
+        self._state.settings_applied = True
+        if not SESSION_SETTINGS or self.driver.capabilities.get("platformName", "").lower() != "android":
+            return
+        try:
+            self.driver.update_settings(SESSION_SETTINGS)
+            logger.info("Applied Appium settings: %s", SESSION_SETTINGS)
+        except Exception:
+            logger.warning("Failed to apply Appium settings", exc_info=True)
+
+    def _wait(self, timeout: float) -> AdaptiveWait:
+        """Return the cached ``AdaptiveWait`` for *timeout*, creating it on first use."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = AdaptiveWait(self.driver, timeout)
+        return wait
 
     # ── Element helpers ───────────────────────────────────────────────────
 
-    def find_element(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> WebElement:
-        """Wait for an element to be present and return it."""
-        import time as _time
-        _start = _time.time()
-        print(f"      [find_element] Looking for {locator[1][-30:]} with timeout={timeout}s...")
-        wait = WebDriverWait(self.driver, timeout)
-        result = wait.until(EC.presence_of_element_located(locator))
-        print(f"      [find_element] Found in {_time.time()-_start:.1f}s")
+    def find_element(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> WebElement:
+        """Wait for an element to be present and return it.
+
+        The element is looked up directly first; the explicit wait (and its
+        polling) only kicks in when it is not there yet.
+        """
+        start = time.monotonic()
+        try:
+            result: WebElement = self.driver.find_element(*locator)
+        except NoSuchElementException:
+            result = self._wait(timeout).until(EC.presence_of_element_located(locator))
+        logger.debug("find_element %s found in %.1fs", locator[1], time.monotonic() - start)
         return result
 
-    def click(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> None:
+    def find_elements(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> list[WebElement]:
+        """Wait for at least one element matching *locator* and return all matches."""
+        return self._wait(timeout).until(EC.presence_of_all_elements_located(locator))
+
+    def click(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> None:
         """Wait for an element to be clickable, then tap it."""
-        wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(EC.element_to_be_clickable(locator))
+        element = self._wait(timeout).until(EC.element_to_be_clickable(locator))
+        element.click()
+        self.invalidate_cache()
+
+    def click_if_displayed(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """Tap the element if it becomes clickable within *timeout*.
+
+        Resolves the element once for both the check and the tap, replacing
+        the ``is_displayed()`` + ``click()`` pair (two lookups).  Returns
+        ``True`` if the element was tapped.
+        """
+        try:
+            element = self._wait(timeout).until(EC.element_to_be_clickable(locator))
+        except TimeoutException:
+            return False
         element.click()
+        self.invalidate_cache()
+        return True
 
-    def tap(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> None:
+    def tap(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> None:
         """Find element and tap it immediately (faster than click)."""
         element = self.find_element(locator, timeout)
         element.click()
+        self.invalidate_cache()
 
-    def type_text(self, locator: tuple[str, str], text: str, timeout: int = DEFAULT_TIMEOUT) -> None:
-        """Clear the field and type *text* into it."""
+    def click_and_wait(
+        self,
+        click_locator: tuple[str, str],
+        wait_locator: tuple[str, str],
+        timeout: float = DEFAULT_TIMEOUT,
+        condition: Callable[..., Any] = EC.visibility_of_element_located,
+    ) -> Any:
+        """Tap *click_locator*, then wait until *condition* holds for *wait_locator*.
+
+        Fuses the "tap, then wait for the next screen" pair so the wait starts
+        polling straight after the tap.  *condition* is any expected-condition
+        factory taking a locator (visibility by default); its result is returned.
+        """
+        self.tap(click_locator, timeout)
+        return self._wait(timeout).until(condition(wait_locator))
+
+    def type_text(self, locator: tuple[str, str], text: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Clear the field and type *text* into it (see ``set_value``)."""
+        self.set_value(locator, text, timeout)
+
+    def set_value(self, locator: tuple[str, str], text: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Replace the field's content with *text* in as few Appium calls as possible."""
         element = self.find_element(locator, timeout)
+        self._set_element_value(element, text)
+
+    def _set_element_value(self, element: WebElement, text: str) -> None:
+        """Replace *element*'s text.
+
+        On Android this is a single ``mobile: replaceElementValue`` call
+        instead of ``clear()`` + ``send_keys()`` (two round-trips).  Other
+        platforms, or drivers without the extension, fall back to the pair.
+        """
+        # Typing may bring up the soft keyboard; remember so hide_keyboard() acts.
+        self._state.keyboard_maybe_shown = True
+        if self.driver.capabilities.get("platformName", "").lower() == "android":
+            try:
+                self.driver.execute_script(
+                    "mobile: replaceElementValue", {"elementId": element.id, "text": text}
+                )
+                return
+            except WebDriverException:
+                logger.debug("mobile: replaceElementValue unavailable — using clear + send_keys")
         element.clear()
         element.send_keys(text)
 
-    def get_text(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> str:
+    def get_text(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> str:
         """Return the visible text of an element."""
         element = self.find_element(locator, timeout)
         return element.text
 
-    def is_displayed(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> bool:
+    def is_displayed(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> bool:
         """Return ``True`` if the element is visible within *timeout*."""
-        import time as _time
-        _start = _time.time()
-        print(f"      [is_displayed] Looking for {locator[1][-30:]} with timeout={timeout}s...")
+        start = time.monotonic()
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
-            print(f"      [is_displayed] Found in {_time.time()-_start:.1f}s")
+            self._wait(timeout).until(EC.visibility_of_element_located(locator))
+            logger.debug("is_displayed %s found in %.1fs", locator[1], time.monotonic() - start)
             return True
         except (TimeoutException, NoSuchElementException):
-            print(f"      [is_displayed] NOT found after {_time.time()-_start:.1f}s")
+            logger.debug("is_displayed %s NOT found after %.1fs", locator[1], time.monotonic() - start)
             return False
 
-    def wait_for_element(self, locator: tuple[str, str], timeout: int = DEFAULT_TIMEOUT) -> WebElement:
+    def wait_for_element(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> WebElement:
         """Explicitly wait for an element to become visible and return it."""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self._wait(timeout).until(EC.visibility_of_element_located(locator))
+
+    # ── Element cache ─────────────────────────────────────────────────────
+    #
+    # The ``*_cached`` readers reuse elements resolved earlier on the same
+    # screen.  Taps and ``go_back()`` may navigate, so they clear the cache;
+    # otherwise a reader could answer from an element left on a previous screen.
+
+    def _cached_find(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> WebElement:
+        """Return the visible element for *locator*, reusing the one resolved earlier on this page."""
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self._element_cache[locator] = self.wait_for_element(locator, timeout)
+        return element
+
+    def _cached_call(
+        self, locator: tuple[str, str], action: Callable[[WebElement], _T], timeout: float = DEFAULT_TIMEOUT
+    ) -> _T:
+        """Run *action* on the cached element, re-resolving it once if it went stale."""
+        try:
+            return action(self._cached_find(locator, timeout))
+        except StaleElementReferenceException:
+            self._element_cache.pop(locator, None)
+            return action(self._cached_find(locator, timeout))
+
+    def get_text_cached(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> str:
+        """Like ``get_text`` but reuses a previously resolved element."""
+        return self._cached_call(locator, lambda el: el.text, timeout)
+
+    def is_displayed_cached(self, locator: tuple[str, str], timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """Like ``is_displayed`` but reuses a previously resolved element."""
+        try:
+            return self._cached_call(locator, lambda el: el.is_displayed(), timeout)
+        except TimeoutException:
+            return False
+
+    def invalidate_cache(self) -> None:
+        """Forget all cached elements (call after the screen changes)."""
+        self._element_cache.clear()
 
     # ── Swipe gestures ────────────────────────────────────────────────────
 
@@ -93,8 +296,14 @@ class BasePage:
         self.driver.swipe(int(start_x), int(start_y), int(end_x), int(end_y), duration)
 
     def _get_screen_size(self) -> tuple[int, int]:
-        """Return (width, height) of the current screen."""
-        size = self.driver.get_window_size()
+        """Return (width, height) of the current screen.
+
+        The size is fetched once per driver and cached, since it does not
+        change during a session (orientation changes are not used here).
+        """
+        size = self._state.window_size
+        if size is None:
+            size = self._state.window_size = self.driver.get_window_size()
         return size["width"], size["height"]
 
     def swipe_up(self, duration: int = 800) -> None:
@@ -120,11 +329,18 @@ class BasePage:
     # ── Screenshots ───────────────────────────────────────────────────────
 
     def take_screenshot(self, name: str) -> str:
-        """Save a screenshot and return the file path."""
-        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-        timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(SCREENSHOT_DIR, f"{name}_{timestamp}.png")
-        self.driver.save_screenshot(file_path)
+        """Capture a screenshot and return the file path.
+
+        The PNG is fetched from Appium on the calling thread, but written to
+        disk in the background; call ``flush_screenshots()`` before reading
+        the file back.
+        """
+        global _screenshot_dir_ready
+        if not _screenshot_dir_ready:
+            os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+            _screenshot_dir_ready = True
+        file_path = os.path.join(SCREENSHOT_DIR, f"{name}_{_SCREENSHOT_PREFIX}_{next(_SCREENSHOT_SEQ)}.png")
+        queue_screenshot_write(file_path, self.driver.get_screenshot_as_png())
         return file_path
 
     # ── Navigation ────────────────────────────────────────────────────────
@@ -132,10 +348,18 @@ class BasePage:
     def go_back(self) -> None:
         """Press the device back button."""
         self.driver.back()
+        self.invalidate_cache()
+
+    def hide_keyboard(self, force: bool = False) -> None:
+        """Dismiss the on-screen keyboard if visible.
 
-    def hide_keyboard(self) -> None:
-        """Dismiss the on-screen keyboard if visible."""
+        Skipped (no Appium call) unless text was typed through ``set_value``
+        since the keyboard was last hidden, or *force* is set.
+        """
+        if not (force or self._state.keyboard_maybe_shown):
+            return
         try:
             self.driver.hide_keyboard()
         except Exception:  # noqa: BLE001 — keyboard may not be present
             pass
+        self._state.keyboard_maybe_shown = False
@@ -31,7 +31,7 @@ class HomePage(BasePage):
         kwargs: dict[str, int] = {}
         if timeout is not None:
             kwargs["timeout"] = timeout
-        return self.get_text(self.WELCOME_MESSAGE, **kwargs)
+        return self.get_text_cached(self.WELCOME_MESSAGE, **kwargs)
 
     def tap_menu(self) -> None:
         """Open the side / hamburger menu."""
@@ -43,4 +43,4 @@ class HomePage(BasePage):
 
     def is_home_displayed(self, timeout: int = 15) -> bool:
         """Return ``True`` if the welcome message is visible (indicates home screen loaded)."""
-        return self.is_displayed(self.WELCOME_MESSAGE, timeout=timeout)
+        return self.is_displayed_cached(self.WELCOME_MESSAGE, timeout=timeout)
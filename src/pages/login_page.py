@@ -6,14 +6,12 @@ from typing import TYPE_CHECKING
 
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages._locators import rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-id prefix for the company app.
-_RID = "com.cathayholdings.vdrf.ta:id"
-
 
 class LoginPage(BasePage):
     """Page object for the application login screen."""
@@ -23,15 +21,14 @@ class LoginPage(BasePage):
     USERNAME_FIELD: tuple[str, str] = (AppiumBy.ACCESSIBILITY_ID, "username_input")
     PASSWORD_FIELD: tuple[str, str] = (AppiumBy.ACCESSIBILITY_ID, "password_input")
     LOGIN_BUTTON: tuple[str, str] = (AppiumBy.ACCESSIBILITY_ID, "login_button")
-    REGISTER_BUTTON: tuple[str, str] = (AppiumBy.ID, "com.cathayholdings.vdrf.ta:id/tv_toolbar_option")
     ERROR_MESSAGE: tuple[str, str] = (AppiumBy.ACCESSIBILITY_ID, "error_message")
 
     # ── Locators (company app — resource IDs) ─────────────────────────────
 
-    PHONE_FIELD: tuple[str, str] = (AppiumBy.ID, f"{_RID}/et_phone_number")
-    PASSWORD_COMPANY_FIELD: tuple[str, str] = (AppiumBy.ID, f"{_RID}/et_possword")
-    CTA_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/cta")
-    REGISTER_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_toolbar_option")
+    PHONE_FIELD: tuple[str, str] = rid("et_phone_number")
+    PASSWORD_COMPANY_FIELD: tuple[str, str] = rid("et_possword")
+    CTA_BUTTON: tuple[str, str] = rid("cta")
+    REGISTER_BUTTON: tuple[str, str] = rid("tv_toolbar_option")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -44,8 +41,8 @@ class LoginPage(BasePage):
         Call this method, then instantiate the expected destination page
         in your test (e.g. ``HomePage`` on success).
         """
-        self.type_text(self.USERNAME_FIELD, username)
-        self.type_text(self.PASSWORD_FIELD, password)
+        self.set_value(self.USERNAME_FIELD, username)
+        self.set_value(self.PASSWORD_FIELD, password)
         self.hide_keyboard()
         self.click(self.LOGIN_BUTTON)
 
@@ -66,4 +63,4 @@ class LoginPage(BasePage):
 
     def is_login_button_displayed(self, timeout: int = 10) -> bool:
         """Return ``True`` if the login button is visible."""
-        return self.is_displayed(self.LOGIN_BUTTON, timeout=timeout)
+        return self.is_displayed_cached(self.LOGIN_BUTTON, timeout=timeout)
@@ -6,14 +6,12 @@ from typing import TYPE_CHECKING
 
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages._locators import RESOURCE_PREFIX, rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-ID prefix for the app under test.
-_PKG = "com.cathayholdings.vdrf.ta:id"
-
 
 class RegisterCreatePasswordPage(BasePage):
     """Page object for the register — create password screen.
@@ -25,9 +23,14 @@ class RegisterCreatePasswordPage(BasePage):
 
     # ── Locators ──────────────────────────────────────────────────────────
 
-    TC_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tc_title")
-    PASSWORD_INPUT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/ic_possword_set")
-    CTA_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/cta")
+    TC_TITLE: tuple[str, str] = rid("tc_title")
+    PASSWORD_INPUT: tuple[str, str] = rid("ic_possword_set")
+    CTA_BUTTON: tuple[str, str] = rid("cta")
+    # Both EditText children of the password component, resolved in one query.
+    PASSWORD_EDIT_TEXTS: tuple[str, str] = (
+        AppiumBy.XPATH,
+        f'//*[@resource-id="{RESOURCE_PREFIX}/ic_possword_set"]//android.widget.EditText',
+    )
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -37,18 +40,16 @@ class RegisterCreatePasswordPage(BasePage):
     def enter_password(self, password: str) -> None:
         """Fill both password fields (new + confirm) with *password*.
 
-        The component ``ic_possword_set`` contains two ``EditText`` children.
+        The component ``ic_possword_set`` contains two ``EditText`` children;
+        both are fetched with a single lookup rather than component → children.
         """
-        component = self.find_element(self.PASSWORD_INPUT)
-        edit_texts = component.find_elements(AppiumBy.CLASS_NAME, "android.widget.EditText")
+        edit_texts = self.find_elements(self.PASSWORD_EDIT_TEXTS)
 
         # First field: new password
-        edit_texts[0].clear()
-        edit_texts[0].send_keys(password)
+        self._set_element_value(edit_texts[0], password)
 
         # Second field: confirm password
-        edit_texts[1].clear()
-        edit_texts[1].send_keys(password)
+        self._set_element_value(edit_texts[1], password)
 
     def tap_next(self) -> None:
         """Tap the CTA / Next button to submit the password."""
@@ -5,14 +5,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from appium.webdriver.common.appiumby import AppiumBy
+from appium.webdriver.extensions.android.nativekey import AndroidKey
 
+from src.pages._locators import rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-ID prefix for the app under test.
-_PKG = "com.cathayholdings.vdrf.ta:id"
+# Android keycodes for digits 0-9, indexed by the digit's value.
+_DIGIT_KEYCODES: tuple[int, ...] = tuple(getattr(AndroidKey, f"DIGIT_{d}") for d in range(10))
 
 
 class RegisterOtpPage(BasePage):
@@ -20,11 +22,11 @@ class RegisterOtpPage(BasePage):
 
     # ── Locators ──────────────────────────────────────────────────────────
 
-    OTP_DESC: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tv_otp_desc")
-    PHONE_NUMBER_DISPLAY: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tv_phone_number")
-    PIN_INPUT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/pcc_pin")
-    CTA_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/btn_primary")  # Verify button
-    HELP_LINK: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/btn_help")
+    OTP_DESC: tuple[str, str] = rid("tv_otp_desc")
+    PHONE_NUMBER_DISPLAY: tuple[str, str] = rid("tv_phone_number")
+    PIN_INPUT: tuple[str, str] = rid("pcc_pin")
+    CTA_BUTTON: tuple[str, str] = rid("btn_primary")  # Verify button
+    HELP_LINK: tuple[str, str] = rid("btn_help")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -38,42 +40,34 @@ class RegisterOtpPage(BasePage):
         1. Find individual EditText children and enter one digit each
         2. Use send_keys on the single EditText field
         3. Fall back to Android keycode events
+
+        ``send_keys`` focuses the target field itself, so no separate
+        ``click()``/``clear()`` or pacing sleeps are issued per digit.
         """
-        import time
-        from appium.webdriver.extensions.android.nativekey import AndroidKey
-        
         component = self.find_element(self.PIN_INPUT)
-        
+
         # Try to find individual digit fields
         digit_fields = component.find_elements(AppiumBy.CLASS_NAME, "android.widget.EditText")
-        
+
         if digit_fields and len(digit_fields) >= len(otp):
             # Method 1: Individual fields (6 separate EditTexts)
-            for i, digit in enumerate(otp):
-                digit_fields[i].click()
-                digit_fields[i].send_keys(digit)
-                time.sleep(0.1)
+            for field, digit in zip(digit_fields[:len(otp)], otp, strict=True):
+                field.send_keys(digit)
         elif digit_fields and len(digit_fields) == 1:
-            # Method 2: Single EditText - use send_keys directly
-            digit_fields[0].click()
-            time.sleep(0.3)
-            digit_fields[0].clear()
+            # Method 2: Single EditText - one send_keys for the whole code
             digit_fields[0].send_keys(otp)
-            time.sleep(0.3)
         else:
             # Method 3: Fall back to keycodes on the component
             component.click()
-            time.sleep(0.5)
             for digit in otp:
-                key_code = getattr(AndroidKey, f"DIGIT_{digit}")
-                self.driver.press_keycode(key_code)
-                time.sleep(0.15)
-        
-        # Brief wait for UI update
-        time.sleep(0.5)
+                self.driver.press_keycode(_DIGIT_KEYCODES[int(digit)])
 
     def tap_verify(self) -> None:
-        """Tap the primary CTA (Verify) button."""
+        """Tap the primary CTA (Verify) button.
+
+        Waits only for the button to be clickable; it does not check that the
+        OTP entry has been fully processed first.
+        """
         self.click(self.CTA_BUTTON)
 
     def tap_resend(self) -> None:
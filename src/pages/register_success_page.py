@@ -4,26 +4,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from appium.webdriver.common.appiumby import AppiumBy
-
+from src.pages._locators import rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-ID prefix for the app under test.
-_PKG = "com.cathayholdings.vdrf.ta:id"
-
 
 class RegisterSuccessPage(BasePage):
     """Page object for the 'Hooray!' registration success screen."""
 
     # ── Locators ──────────────────────────────────────────────────────────
 
-    RESULT_COMPONENT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/resultComponent")
-    GET_CREDIT_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/btn_primary")
-    EXPLORE_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/btn_secondary")
-    TITLE_TEXT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tv_title")
+    RESULT_COMPONENT: tuple[str, str] = rid("resultComponent")
+    GET_CREDIT_BUTTON: tuple[str, str] = rid("btn_primary")
+    EXPLORE_BUTTON: tuple[str, str] = rid("btn_secondary")
+    TITLE_TEXT: tuple[str, str] = rid("tv_title")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -40,10 +36,10 @@ class RegisterSuccessPage(BasePage):
 
     def get_title(self) -> str:
         """Return the title text (expected to contain 'Hooray!')."""
-        return self.get_text(self.TITLE_TEXT)
+        return self.get_text_cached(self.TITLE_TEXT)
 
     # ── Assertions ────────────────────────────────────────────────────────
 
     def is_page_displayed(self, timeout: int = 10) -> bool:
         """Return ``True`` if the success screen is visible."""
-        return self.is_displayed(self.RESULT_COMPONENT, timeout=timeout)
+        return self.is_displayed_cached(self.RESULT_COMPONENT, timeout=timeout)
@@ -6,23 +6,27 @@ from typing import TYPE_CHECKING
 
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages._locators import RESOURCE_PREFIX, rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-ID prefix for the app under test.
-_PKG = "com.cathayholdings.vdrf.ta:id"
-
 
 class RegisterVerifyEmailPage(BasePage):
     """Page object for the register — verify email screen."""
 
     # ── Locators ──────────────────────────────────────────────────────────
 
-    TC_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tc_title")
-    EMAIL_INPUT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/ic_email")
-    CTA_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/cta")
+    TC_TITLE: tuple[str, str] = rid("tc_title")
+    EMAIL_INPUT: tuple[str, str] = rid("ic_email")
+    # The EditText inside the component, matched server-side in one lookup.
+    EMAIL_EDIT_TEXT: tuple[str, str] = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        f'new UiSelector().resourceId("{RESOURCE_PREFIX}/ic_email")'
+        '.childSelector(new UiSelector().className("android.widget.EditText"))',
+    )
+    CTA_BUTTON: tuple[str, str] = rid("cta")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -32,13 +36,10 @@ class RegisterVerifyEmailPage(BasePage):
     def enter_email(self, email: str) -> None:
         """Type an email address into the InputComponent.
 
-        The component (``ic_email``) wraps an ``EditText``; we locate
-        the component first, then find the child input.
+        The component (``ic_email``) wraps an ``EditText``; a single
+        UiSelector resolves the child input directly.
         """
-        component = self.find_element(self.EMAIL_INPUT)
-        edit_text = component.find_element(AppiumBy.CLASS_NAME, "android.widget.EditText")
-        edit_text.clear()
-        edit_text.send_keys(email)
+        self.set_value(self.EMAIL_EDIT_TEXT, email)
 
     def tap_next(self) -> None:
         """Tap the CTA / Next button to submit the email."""
@@ -6,23 +6,27 @@ from typing import TYPE_CHECKING
 
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages._locators import RESOURCE_PREFIX, rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-ID prefix for the app under test.
-_PKG = "com.cathayholdings.vdrf.ta:id"
-
 
 class RegisterVerifyPhonePage(BasePage):
     """Page object for the register — verify phone number screen."""
 
     # ── Locators ──────────────────────────────────────────────────────────
 
-    TC_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/tc_title")
-    PHONE_INPUT: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/ic_phone_number")
-    CTA_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_PKG}/cta")
+    TC_TITLE: tuple[str, str] = rid("tc_title")
+    PHONE_INPUT: tuple[str, str] = rid("ic_phone_number")
+    # The EditText inside the component, matched server-side in one lookup.
+    PHONE_EDIT_TEXT: tuple[str, str] = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        f'new UiSelector().resourceId("{RESOURCE_PREFIX}/ic_phone_number")'
+        '.childSelector(new UiSelector().className("android.widget.EditText"))',
+    )
+    CTA_BUTTON: tuple[str, str] = rid("cta")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -32,13 +36,10 @@ class RegisterVerifyPhonePage(BasePage):
     def enter_phone_number(self, phone: str) -> None:
         """Type a phone number into the InputPhoneNumberComponent.
 
-        The component (``ic_phone_number``) wraps an ``EditText``; we
-        locate the component first, then find the child input.
+        The component (``ic_phone_number``) wraps an ``EditText``; a
+        single UiSelector resolves the child input directly.
         """
-        component = self.find_element(self.PHONE_INPUT)
-        edit_text = component.find_element(AppiumBy.CLASS_NAME, "android.widget.EditText")
-        edit_text.clear()
-        edit_text.send_keys(phone)
+        self.set_value(self.PHONE_EDIT_TEXT, phone)
 
     def tap_next(self) -> None:
         """Tap the CTA / Next button to submit the phone number."""
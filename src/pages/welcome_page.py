@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING
 
-from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
+from src.pages._locators import rid
 from src.pages.base_page import BasePage
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-# Full resource-id prefix for the company app.
-_RID = "com.cathayholdings.vdrf.ta:id"
+# Upper bound for a dismissed announcement dialog to animate away.
+_DIALOG_CLOSE_TIMEOUT = 0.5
 
 
 class WelcomePage(BasePage):
@@ -33,31 +33,31 @@ class WelcomePage(BasePage):
 
     # ── Locators: Announcement dialog ─────────────────────────────────────
 
-    DIALOG_CARD: tuple[str, str] = (AppiumBy.ID, f"{_RID}/card_dialog")
-    DIALOG_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_title")
-    DIALOG_CONTENT: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_content")
-    DIALOG_GOT_IT: tuple[str, str] = (AppiumBy.ID, f"{_RID}/positiveButton")
-    DIALOG_PROGRESS: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_progress")
+    DIALOG_CARD: tuple[str, str] = rid("card_dialog")
+    DIALOG_TITLE: tuple[str, str] = rid("tv_title")
+    DIALOG_CONTENT: tuple[str, str] = rid("tv_content")
+    DIALOG_GOT_IT: tuple[str, str] = rid("positiveButton")
+    DIALOG_PROGRESS: tuple[str, str] = rid("tv_progress")
 
     # ── Locators: Welcome/visitor screen ──────────────────────────────────
 
-    VISITOR_CONTAINER: tuple[str, str] = (AppiumBy.ID, f"{_RID}/fcv_visitor")
-    LANGUAGE_TOGGLE: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_change_language")
-    GET_CREDIT_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/btn_primary")
-    LOGIN_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/btn_secondary")
-    BANNER_VIEW: tuple[str, str] = (AppiumBy.ID, f"{_RID}/bannerView")
+    VISITOR_CONTAINER: tuple[str, str] = rid("fcv_visitor")
+    LANGUAGE_TOGGLE: tuple[str, str] = rid("tv_change_language")
+    GET_CREDIT_BUTTON: tuple[str, str] = rid("btn_primary")
+    LOGIN_BUTTON: tuple[str, str] = rid("btn_secondary")
+    BANNER_VIEW: tuple[str, str] = rid("bannerView")
 
     # ── Locators: Intro popup (after Get Credit) ──────────────────────────
 
-    INTRO_CLOSE_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/ib_close")
-    INTRO_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_RID}/title")
-    BECOME_MEMBER_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/btn_primary")
+    INTRO_CLOSE_BUTTON: tuple[str, str] = rid("ib_close")
+    INTRO_TITLE: tuple[str, str] = rid("title")
+    BECOME_MEMBER_BUTTON: tuple[str, str] = rid("btn_primary")
 
     # ── Locators: Terms & Conditions popup ────────────────────────────────
 
-    TERMS_DIALOG_TITLE: tuple[str, str] = (AppiumBy.ID, f"{_RID}/tv_dialog_title")
-    TERMS_LIST: tuple[str, str] = (AppiumBy.ID, f"{_RID}/rv_terms")
-    AGREE_TERMS_BUTTON: tuple[str, str] = (AppiumBy.ID, f"{_RID}/btn_primary")
+    TERMS_DIALOG_TITLE: tuple[str, str] = rid("tv_dialog_title")
+    TERMS_LIST: tuple[str, str] = rid("rv_terms")
+    AGREE_TERMS_BUTTON: tuple[str, str] = rid("btn_primary")
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
@@ -77,17 +77,19 @@ class WelcomePage(BasePage):
 
         Returns the number of dialogs dismissed. Keeps tapping 'Got It'
         until no more dialogs appear (up to *max_dialogs* safety limit).
+        After each tap, briefly waits for the dialog to close so the next
+        probe cannot see it again mid-animation.
         """
-        import time
-
         dismissed = 0
         for _ in range(max_dialogs):
-            if self.is_dialog_displayed(timeout=timeout):
-                self.dismiss_dialog()
-                dismissed += 1
-                time.sleep(0.3)
-            else:
+            # Probe and tap 'Got It' in one lookup instead of checking the card first.
+            if not self.click_if_displayed(self.DIALOG_GOT_IT, timeout=timeout):
                 break
+            dismissed += 1
+            # Short bound: when the next announcement reuses the dialog view, the
+            # card never disappears and the probe above picks it up instead.
+            with contextlib.suppress(TimeoutException):
+                self._wait(_DIALOG_CLOSE_TIMEOUT).until(EC.invisibility_of_element_located(self.DIALOG_CARD))
         return dismissed
 
     # ── Welcome screen actions ────────────────────────────────────────────
@@ -138,19 +140,20 @@ class WelcomePage(BasePage):
         """Complete the full navigation from welcome screen to registration.
 
         Handles: Get Credit → Intro popup → T&C popup → Verify Phone screen.
-        
+
         Both the intro popup and T&C popup use btn_primary as the action button,
-        so we tap it twice after the initial Get Credit tap.
+        so we tap it twice after the initial Get Credit tap. Each tap waits
+        for the popup it opens rather than sleeping, so the shared button is
+        never tapped on the wrong screen.
         """
-        import time
-
         # Step 1: Tap "Get Credit" on welcome screen
-        self.tap_get_credit(timeout=timeout)
-        time.sleep(1)
+        self.click_and_wait(self.GET_CREDIT_BUTTON, self.INTRO_TITLE, timeout=timeout)
 
         # Step 2: Tap "Become a Member" on intro popup
-        self.tap_become_member(timeout=timeout)
-        time.sleep(1)
+        self.click_and_wait(self.BECOME_MEMBER_BUTTON, self.TERMS_DIALOG_TITLE, timeout=timeout)
 
         # Step 3: Tap "I Agree" on T&C popup
-        self.tap_agree_terms(timeout=timeout)
+        self.click_and_wait(
+            self.AGREE_TERMS_BUTTON, self.TERMS_DIALOG_TITLE, timeout=timeout,
+            condition=EC.invisibility_of_element_located,
+        )
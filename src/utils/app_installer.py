@@ -60,14 +60,20 @@ class AppInstaller:
 
     @classmethod
     def _is_installed_android(cls, serial: str, package: str) -> bool:
-        """Check if an Android package is installed via ``adb``."""
+        """Check if an Android package is installed via ``adb``.
+
+        Uses ``pm path`` rather than ``pm list packages``: it resolves the one
+        package directly instead of listing (and filtering) every package.
+        """
         try:
             result = subprocess.run(
-                ["adb", "-s", serial, "shell", "pm", "list", "packages", package],
-                capture_output=True, text=True, timeout=15,
+                ["adb", "-s", serial, "shell", "pm", "path", package],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=15,
             )
-            # pm list packages returns lines like "package:com.clvn.sample"
-            installed = f"package:{package}" in result.stdout
+            # pm path prints "package:/data/app/.../base.apk" when installed, nothing otherwise.
+            # (Older adb versions don't forward the shell exit code, so check stdout —
+            # as raw bytes, since only the prefix matters.)
+            installed = result.stdout.startswith(b"package:")
             logger.info(
                 "App %s on %s: %s",
                 package, serial, "INSTALLED" if installed else "NOT INSTALLED",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -9,14 +11,22 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
-# Load .env from project root (if present) so env vars are available early.
-load_dotenv()
+try:  # libyaml-backed parser when PyYAML was built with it; pure Python otherwise.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover — depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 # Resolve project root (two levels up from this file: src/utils/ → project root).
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _CONFIG_DIR = _PROJECT_ROOT / "config"
 
 
+@functools.cache
+def _load_env_once() -> None:
+    """Load ``.env`` from the project root (if present) the first time config is needed."""
+    load_dotenv()
+
+
 class ConfigLoader:
     """Load and merge YAML configuration files.
 
@@ -30,38 +40,65 @@ class ConfigLoader:
     def _load_yaml(file_path: Path) -> dict[str, Any]:
         """Read a YAML file and return its contents as a dict."""
         with open(file_path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=_YamlLoader)
         return data if isinstance(data, dict) else {}
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def load_settings(cls) -> dict[str, Any]:
-        """Load ``config/settings.yaml``."""
-        return cls._load_yaml(_CONFIG_DIR / "settings.yaml")
+        """Load ``config/settings.yaml`` (parsed once per process).
+
+        The returned dict is shared between callers — treat it as read-only.
+        An ``EXPLICIT_WAIT`` environment variable (seconds) overrides
+        ``timeouts.explicit_wait`` so CI can tune the default wait without
+        editing the file.  Only the process environment is consulted here;
+        ``.env`` is loaded by ``load_merged_config``.
+        """
+        settings = cls._load_yaml(_CONFIG_DIR / "settings.yaml")
+        env_explicit_wait = os.getenv("EXPLICIT_WAIT")
+        if env_explicit_wait:
+            try:
+                explicit_wait = float(env_explicit_wait)
+            except ValueError:
+                raise ValueError(
+                    f"EXPLICIT_WAIT must be a number of seconds, got {env_explicit_wait!r}"
+                ) from None
+            settings["timeouts"] = {**(settings.get("timeouts") or {}), "explicit_wait": explicit_wait}
+        return settings
 
     @classmethod
+    @functools.cache
     def load_platform_config(cls, platform: str) -> dict[str, Any]:
-        """Load the platform-specific config (``android.yaml`` or ``ios.yaml``)."""
+        """Load the platform-specific config (``android.yaml`` or ``ios.yaml``).
+
+        Parsed once per platform and shared between callers — treat it as
+        read-only (``load_merged_config`` returns a private copy).
+        """
         filename = f"{platform.lower()}.yaml"
         path = _CONFIG_DIR / filename
-        if not path.exists():
-            raise FileNotFoundError(f"Platform config not found: {path}")
-        return cls._load_yaml(path)
+        try:
+            return cls._load_yaml(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Platform config not found: {path}") from None
 
     @classmethod
     def load_merged_config(cls, platform: str) -> dict[str, Any]:
         """Merge ``settings.yaml`` with the platform config.
 
         Keys in the platform file override keys in settings when they
-        share the same top-level name.  Environment variable overrides
-        are applied last:
+        share the same top-level name.  The YAML files are parsed once and
+        cached; each call returns a fresh deep copy that callers may mutate.
+        Environment variable overrides are applied last:
 
         * ``APPIUM_URL``   → ``appium.server_url``
         * ``WIREMOCK_URL`` → ``wiremock.base_url``
         """
+        _load_env_once()
         settings = cls.load_settings()
         platform_cfg = cls.load_platform_config(platform)
 
-        merged: dict[str, Any] = {**settings, **platform_cfg}
+        # Deep copy so callers (and the env overrides below) never mutate cached settings.
+        merged: dict[str, Any] = copy.deepcopy({**settings, **platform_cfg})
 
         # Environment-variable overrides
         env_appium_url = os.getenv("APPIUM_URL")
@@ -74,6 +111,12 @@ class ConfigLoader:
 
         return merged
 
+    @classmethod
+    def reset_cache(cls) -> None:
+        """Drop cached YAML so the next load re-reads the files from disk."""
+        cls.load_settings.cache_clear()
+        cls.load_platform_config.cache_clear()
+
     @classmethod
     def resolve_path(cls, relative_path: str) -> Path:
         """Resolve a path relative to the project root.
@@ -5,42 +5,124 @@ from __future__ import annotations
 import logging
 import re
 import subprocess
-from typing import List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import ClassVar
 
 from src.models.device_info import DeviceInfo
 
 logger = logging.getLogger(__name__)
 
+# Subprocess timeouts (seconds).  adb queries answer in well under a second on a
+# healthy host (5s still covers an adb server cold start); xcrun can take a
+# while the first time it loads CoreSimulator/device support.
+ADB_TIMEOUT = 5.0
+XCRUN_TIMEOUT = 15.0
+
+# System properties read from every discovered Android device.
+_ANDROID_PROPS = ("ro.build.version.release", "ro.product.manufacturer", "ro.product.model")
+
+# xctrace line: "Device Name (version) (udid)"
+_IOS_DEVICE_RE = re.compile(r"^(.+?)\s+\((\d+[\d.]*)\)\s+\(([A-Fa-f0-9-]+)\)$")
+# simctl section header: "-- iOS 17.4 --"
+_IOS_VERSION_RE = re.compile(r"^-- iOS ([\d.]+) --$")
+# simctl line: "iPhone 15 (UDID) (Booted)"
+_IOS_BOOTED_RE = re.compile(r"^(.+?)\s+\(([A-Fa-f0-9-]+)\)\s+\(Booted\)$")
+
+# A finished Android poll is reused for _POLL_TTL seconds; callers arriving
+# while a poll is in flight wait up to _POLL_WAIT_TIMEOUT seconds for it.
+_POLL_TTL = 10.0
+_POLL_WAIT_TIMEOUT = 30.0
+
+# How long a full discover_all() result (Android + iOS) is reused.
+_DISCOVER_ALL_TTL = 30.0
+
 
 class DeviceManager:
     """Discover real devices, emulators, and simulators."""
 
+    # ── Discovery caches (cleared by invalidate_cache) ────────────
+
+    # serial → {property: value}; filled by _adb_getprops.
+    _prop_cache: ClassVar[dict[str, dict[str, str]]] = {}
+    # (monotonic timestamp, devices) of the last discover_all().
+    _all_cache: ClassVar[tuple[float, list[DeviceInfo]] | None] = None
+    # (monotonic timestamp, devices) of the last adb poll, and the poll in flight.
+    _poll_cache: ClassVar[tuple[float, list[DeviceInfo]] | None] = None
+    _poll_future: ClassVar[Future[list[DeviceInfo]] | None] = None
+    _poll_lock: ClassVar[threading.Lock] = threading.Lock()
+
     # ── Public API ────────────────────────────────────────────────
 
     @classmethod
-    def discover_all(cls) -> List[DeviceInfo]:
-        """Return all connected Android + iOS devices."""
-        devices: List[DeviceInfo] = []
-        devices.extend(cls.discover_android())
-        devices.extend(cls.discover_ios())
+    def discover_all(cls) -> list[DeviceInfo]:
+        """Return all connected Android + iOS devices.
+
+        The result is reused for ``_DISCOVER_ALL_TTL`` seconds; call
+        ``invalidate_cache()`` to force a fresh scan.
+        """
+        cached = cls._all_cache
+        if cached is not None and time.monotonic() - cached[0] < _DISCOVER_ALL_TTL:
+            return list(cached[1])
+
+        # adb and xcrun are independent tools — query them side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            android = executor.submit(cls.discover_android)
+            ios = executor.submit(cls.discover_ios)
+            devices: list[DeviceInfo] = android.result() + ios.result()
         logger.info("Discovered %d device(s) total", len(devices))
-        return devices
+        cls._all_cache = (time.monotonic(), devices)
+        return list(devices)
+
+    @classmethod
+    def discover_android(cls) -> list[DeviceInfo]:
+        """Discover connected Android devices and emulators via ``adb``.
+
+        Only one ``adb`` poll runs at a time: callers arriving while a poll
+        is in progress wait (up to 30s) for its result, and a result younger
+        than ``_POLL_TTL`` seconds is returned without polling again.
+        """
+        with cls._poll_lock:
+            cached = cls._poll_cache
+            if cached is not None and time.monotonic() - cached[0] < _POLL_TTL:
+                return list(cached[1])
+            in_flight = cls._poll_future
+            if in_flight is None:
+                future: Future[list[DeviceInfo]] = Future()
+                cls._poll_future = future
+
+        if in_flight is not None:
+            return list(in_flight.result(timeout=_POLL_WAIT_TIMEOUT))
+
+        try:
+            devices = cls._poll_android()
+        except BaseException as exc:
+            with cls._poll_lock:
+                cls._poll_future = None
+            future.set_exception(exc)
+            raise
+        with cls._poll_lock:
+            cls._poll_cache = (time.monotonic(), devices)
+            cls._poll_future = None
+        future.set_result(devices)
+        return list(devices)
 
     @classmethod
-    def discover_android(cls) -> List[DeviceInfo]:
-        """Discover connected Android devices and emulators via ``adb``."""
-        devices: List[DeviceInfo] = []
+    def _poll_android(cls) -> list[DeviceInfo]:
+        """Run ``adb devices -l`` and build a ``DeviceInfo`` per ready device."""
+        devices: list[DeviceInfo] = []
 
         try:
             result = subprocess.run(
                 ["adb", "devices", "-l"],
-                capture_output=True, text=True, timeout=15,
+                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=ADB_TIMEOUT,
             )
         except FileNotFoundError:
             logger.warning("adb not found — skipping Android device discovery")
             return devices
         except subprocess.TimeoutExpired:
-            logger.warning("adb devices timed out")
+            logger.warning("adb devices timed out — the adb server may be stuck (try `adb kill-server`)")
             return devices
 
         for line in result.stdout.strip().splitlines()[1:]:  # skip header
@@ -61,64 +143,108 @@ class DeviceManager:
                     k, v = part.split(":", 1)
                     props[k] = v
 
-            device = DeviceInfo(
+            devices.append(DeviceInfo(
                 serial=serial,
                 platform="android",
                 device_name=props.get("model", "").replace("_", " "),
                 model=props.get("model", ""),
                 is_emulator=serial.startswith("emulator-") or "sdk" in props.get("model", "").lower(),
-            )
-
-            # Fetch extra properties from the device
-            device.platform_version = cls._adb_getprop(serial, "ro.build.version.release")
-            device.manufacturer = cls._adb_getprop(serial, "ro.product.manufacturer")
+            ))
 
-            if not device.device_name:
-                device.device_name = cls._adb_getprop(serial, "ro.product.model")
+        if not devices:
+            return devices
 
+        # Fetch extra properties from every device concurrently (one adb shell each).
+        # ro.product.model is only a fallback for when ``-l`` reported no model.
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            futures = {
+                executor.submit(
+                    cls._adb_getprops,
+                    device.serial,
+                    _ANDROID_PROPS if not device.device_name else _ANDROID_PROPS[:2],
+                ): device
+                for device in devices
+            }
+            for future in as_completed(futures):
+                device = futures[future]
+                props = future.result()
+                device.platform_version = props["ro.build.version.release"]
+                device.manufacturer = props["ro.product.manufacturer"]
+                if not device.device_name:
+                    device.device_name = props["ro.product.model"]
+
+        for device in devices:
             logger.info("Found Android device: %s", device.display_name)
-            devices.append(device)
 
         return devices
 
     @classmethod
-    def discover_ios(cls) -> List[DeviceInfo]:
+    def invalidate_cache(cls, serial: str | None = None) -> None:
+        """Forget cached device properties for *serial* (or all devices), e.g. after a reboot.
+
+        Also drops the last ``adb devices`` poll and ``discover_all`` results.
+        """
+        if serial is None:
+            cls._prop_cache.clear()
+        else:
+            cls._prop_cache.pop(serial, None)
+        cls._all_cache = None
+        with cls._poll_lock:
+            cls._poll_cache = None
+
+    @classmethod
+    def discover_ios(cls) -> list[DeviceInfo]:
         """Discover connected iOS devices and simulators via ``xcrun``."""
-        devices: List[DeviceInfo] = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # ── Real devices via xcrun xctrace ──
+            real = executor.submit(cls._discover_ios_real_devices)
 
-        # ── Real devices via xcrun xctrace ──
-        devices.extend(cls._discover_ios_real_devices())
+            # ── Booted simulators via xcrun simctl ──
+            simulators = executor.submit(cls._discover_ios_simulators)
 
-        # ── Booted simulators via xcrun simctl ──
-        devices.extend(cls._discover_ios_simulators())
-
-        return devices
+            return real.result() + simulators.result()
 
     # ── Android helpers ───────────────────────────────────────────
 
     @classmethod
-    def _adb_getprop(cls, serial: str, prop: str) -> str:
-        """Read a single system property from an Android device."""
-        try:
-            result = subprocess.run(
-                ["adb", "-s", serial, "shell", "getprop", prop],
-                capture_output=True, text=True, timeout=10,
-            )
-            return result.stdout.strip()
-        except Exception:
-            return ""
+    def _adb_getprops(cls, serial: str, props: tuple[str, ...]) -> dict[str, str]:
+        """Read several system properties from an Android device in one ``adb shell``.
+
+        ``getprop`` prints exactly one line per property (empty when unset),
+        so output lines map back to *props* by position.  The properties
+        read here are fixed for the life of a boot, so successful reads are
+        cached per serial and only missing ones go to the device (see
+        ``invalidate_cache``).  Any failure yields empty strings, uncached.
+        """
+        cached = cls._prop_cache.setdefault(serial, {})
+        missing = [prop for prop in props if prop not in cached]
+        fetched: dict[str, str] = {}
+        if missing:
+            try:
+                result = subprocess.run(
+                    ["adb", "-s", serial, "shell", "; ".join(f"getprop {prop}" for prop in missing)],
+                    stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=ADB_TIMEOUT,
+                )
+                values = [line.strip() for line in result.stdout.splitlines()]
+                # A short read (partial output) still yields usable leading values.
+                fetched = dict(zip(missing, values, strict=False))
+                if result.returncode == 0 and len(values) == len(missing):
+                    cached.update(fetched)
+            except Exception:
+                pass
+        return {prop: cached.get(prop, fetched.get(prop, "")) for prop in props}
 
     # ── iOS helpers ───────────────────────────────────────────────
 
     @classmethod
-    def _discover_ios_real_devices(cls) -> List[DeviceInfo]:
+    def _discover_ios_real_devices(cls) -> list[DeviceInfo]:
         """Find physical iOS devices via ``xcrun xctrace list devices``."""
-        devices: List[DeviceInfo] = []
+        devices: list[DeviceInfo] = []
 
         try:
             result = subprocess.run(
                 ["xcrun", "xctrace", "list", "devices"],
-                capture_output=True, text=True, timeout=15,
+                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=XCRUN_TIMEOUT,
             )
         except FileNotFoundError:
             logger.warning("xcrun not found — skipping iOS device discovery")
@@ -148,7 +274,7 @@ class DeviceManager:
                 continue
 
             # Skip the host Mac line
-            match = re.match(r"^(.+?)\s+\((\d+[\d.]*)\)\s+\(([A-Fa-f0-9-]+)\)$", line)
+            match = _IOS_DEVICE_RE.match(line)
             if match:
                 name, version, udid = match.groups()
                 device = DeviceInfo(
@@ -165,14 +291,14 @@ class DeviceManager:
         return devices
 
     @classmethod
-    def _discover_ios_simulators(cls) -> List[DeviceInfo]:
+    def _discover_ios_simulators(cls) -> list[DeviceInfo]:
         """Find booted iOS simulators via ``xcrun simctl list``."""
-        devices: List[DeviceInfo] = []
+        devices: list[DeviceInfo] = []
 
         try:
             result = subprocess.run(
                 ["xcrun", "simctl", "list", "devices", "booted"],
-                capture_output=True, text=True, timeout=15,
+                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=XCRUN_TIMEOUT,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return devices
@@ -183,12 +309,12 @@ class DeviceManager:
         for line in result.stdout.splitlines():
             line = line.strip()
 
-            version_match = re.match(r"^-- iOS ([\d.]+) --$", line)
+            version_match = _IOS_VERSION_RE.match(line)
             if version_match:
                 current_version = version_match.group(1)
                 continue
 
-            device_match = re.match(r"^(.+?)\s+\(([A-Fa-f0-9-]+)\)\s+\(Booted\)$", line)
+            device_match = _IOS_BOOTED_RE.match(line)
             if device_match:
                 name, udid = device_match.groups()
                 device = DeviceInfo(
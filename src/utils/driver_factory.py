@@ -13,6 +13,11 @@ from src.utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+# Default base ports of the UiAutomator2 server and WebDriverAgent.  Sessions
+# running in parallel against one Appium server each need their own port.
+_SYSTEM_PORT_BASE = 8200
+_WDA_LOCAL_PORT_BASE = 8100
+
 
 class DriverFactory:
     """Factory for creating configured Appium ``WebDriver`` instances.
@@ -45,7 +50,9 @@ class DriverFactory:
     # ── Dynamic: from DeviceInfo ──────────────────────────────────
 
     @classmethod
-    def get_driver_for_device(cls, device: DeviceInfo) -> appium_webdriver.Remote:
+    def get_driver_for_device(
+        cls, device: DeviceInfo, port_offset: int = 0
+    ) -> appium_webdriver.Remote:
         """Build a driver with capabilities injected from a discovered device.
 
         YAML configs are still loaded for defaults (app path, timeouts, etc.),
@@ -56,6 +63,10 @@ class DriverFactory:
         ----------
         device:
             A ``DeviceInfo`` instance from ``DeviceManager``.
+        port_offset:
+            Added to the UiAutomator2 ``systemPort`` / WDA ``wdaLocalPort`` so
+            that sessions running in parallel don't collide.  Ignored when the
+            port is set explicitly in the YAML capabilities.
         """
         merged_config = ConfigLoader.load_merged_config(device.platform)
         capabilities: dict[str, Any] = merged_config.get("capabilities", {})
@@ -72,6 +83,8 @@ class DriverFactory:
                 appium_opts["platformVersion"] = device.platform_version
             # Use UiAutomator2 for Android
             appium_opts.setdefault("automationName", "UiAutomator2")
+            if "appium:systemPort" not in capabilities:
+                appium_opts.setdefault("systemPort", _SYSTEM_PORT_BASE + port_offset)
 
         elif device.platform == "ios":
             appium_opts["udid"] = device.serial
@@ -80,6 +93,8 @@ class DriverFactory:
                 appium_opts["platformVersion"] = device.platform_version
             # Use XCUITest for iOS
             appium_opts.setdefault("automationName", "XCUITest")
+            if "appium:wdaLocalPort" not in capabilities:
+                appium_opts.setdefault("wdaLocalPort", _WDA_LOCAL_PORT_BASE + port_offset)
 
         logger.info(
             "Building driver for device: %s [%s]",
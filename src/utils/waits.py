@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Literal, TypeVar
 
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from src.utils.config_loader import ConfigLoader
 
@@ -14,59 +15,112 @@ if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
 
+_T = TypeVar("_T")
+
 _settings = ConfigLoader.load_settings()
-DEFAULT_TIMEOUT: int = _settings.get("timeouts", {}).get("explicit_wait", 15)
+DEFAULT_TIMEOUT: float = (_settings.get("timeouts") or {}).get("explicit_wait", 15)
+# Backoff ceiling for _poll — the steady-state interval once an element is slow to show up.
+_MAX_POLL_INTERVAL: float = (_settings.get("timeouts") or {}).get("poll_frequency", 0.5)
+_FIRST_POLL_INTERVAL = 0.01
+
+
+def _poll(driver: WebDriver, condition: Callable[[WebDriver], Literal[False] | _T], timeout: float) -> _T:
+    """Evaluate *condition* until it returns a truthy value, backing off exponentially.
+
+    Polls after 10 ms, 20 ms, 40 ms, … up to ``_MAX_POLL_INTERVAL``, so
+    elements that appear quickly are picked up almost immediately while
+    slow ones are not hammered.  ``NoSuchElementException`` counts as "not
+    yet".  Raises ``TimeoutException`` once *timeout* seconds have passed.
+    """
+    deadline = time.monotonic() + timeout
+    interval = _FIRST_POLL_INTERVAL
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                return value
+        except NoSuchElementException:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f"Condition not met within {timeout}s")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, _MAX_POLL_INTERVAL)
+
+
+class AdaptiveWait:
+    """Drop-in for Selenium's ``WebDriverWait`` that polls via ``_poll``.
+
+    Only ``until`` is provided — the one method page objects use.
+    """
+
+    def __init__(self, driver: WebDriver, timeout: float) -> None:
+        self._driver = driver
+        self._timeout = timeout
+
+    def until(self, method: Callable[[WebDriver], Literal[False] | _T]) -> _T:
+        """Return *method*'s first truthy result; raise ``TimeoutException`` after the timeout."""
+        return _poll(self._driver, method, self._timeout)
 
 
 def wait_for_element_visible(
     driver: WebDriver,
     locator: tuple[str, str],
-    timeout: int = DEFAULT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> WebElement:
     """Wait until an element is both present and visible.
 
     Raises ``TimeoutException`` if the element does not appear within *timeout*.
     """
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.visibility_of_element_located(locator))
+    return _poll(driver, EC.visibility_of_element_located(locator), timeout)
 
 
 def wait_for_element_clickable(
     driver: WebDriver,
     locator: tuple[str, str],
-    timeout: int = DEFAULT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> WebElement:
     """Wait until an element is visible **and** enabled (clickable).
 
     Raises ``TimeoutException`` if the condition is not met within *timeout*.
     """
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.element_to_be_clickable(locator))
+    return _poll(driver, EC.element_to_be_clickable(locator), timeout)
 
 
 def wait_for_text_present(
     driver: WebDriver,
     locator: tuple[str, str],
     text: str,
-    timeout: int = DEFAULT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> bool:
     """Wait until the element identified by *locator* contains *text*.
 
     Returns ``True`` when the text is found; raises ``TimeoutException`` otherwise.
     """
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.text_to_be_present_in_element(locator, text))
+    return _poll(driver, EC.text_to_be_present_in_element(locator, text), timeout)
 
 
 def wait_for_element_gone(
     driver: WebDriver,
     locator: tuple[str, str],
-    timeout: int = DEFAULT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
 ) -> bool:
     """Wait until the element is no longer visible (or absent from the DOM).
 
     Returns ``True`` when the element disappears; raises ``TimeoutException``
     if it is still visible after *timeout*.
     """
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.invisibility_of_element_located(locator))
+    return _poll(driver, EC.invisibility_of_element_located(locator), timeout)
+
+
+def wait_for_any_element_present(
+    driver: WebDriver,
+    locators: list[tuple[str, str]],
+    timeout: float = DEFAULT_TIMEOUT,
+) -> WebElement:
+    """Wait until at least one of *locators* is present in the DOM.
+
+    Returns the first element found; raises ``TimeoutException`` if none of
+    them appears within *timeout*.
+    """
+    return _poll(driver, EC.any_of(*(EC.presence_of_element_located(loc) for loc in locators)), timeout)
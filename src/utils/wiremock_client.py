@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+import re
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # orjson parses/serializes several times faster and emits bytes directly.
+    import orjson
+except ImportError:  # pragma: no cover — optional speedup
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize *obj* to JSON bytes with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_mapping_bytes(path: Path) -> bytes:
+    """Return a mapping file's raw bytes, read from disk once per process."""
+    return path.read_bytes()
+
 
 class WireMockClient:
     """Thin REST client for WireMock's ``__admin`` API.
@@ -27,13 +59,33 @@ class WireMockClient:
     def __init__(self, base_url: str) -> None:
         self.base_url = base_url.rstrip("/")
         self._admin = f"{self.base_url}/__admin"
+        # Set whenever stubs are registered outside the baseline; cleared by
+        # restore_baseline().
+        self.stubs_dirty = False
+        # Stack of baseline layers (session init stubs, then per-class extras)
+        # that restore_baseline() re-imports after a full reset.
+        self._baseline_layers: list[list[dict[str, Any]]] = []
+        # One pooled keep-alive session for all admin calls; transient
+        # gateway errors on idempotent requests are retried.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
 
     # ── Health ────────────────────────────────────────────────────────────
 
     def is_healthy(self, timeout: float = 5.0) -> bool:
         """Return ``True`` if WireMock is reachable."""
         try:
-            resp = requests.get(f"{self._admin}/mappings", timeout=timeout)
+            resp = self._session.get(f"{self._admin}/mappings", timeout=timeout)
             return resp.status_code == 200
         except requests.ConnectionError:
             return False
@@ -42,50 +94,127 @@ class WireMockClient:
 
     def create_stub(self, mapping: dict[str, Any]) -> dict[str, Any]:
         """Create a new stub mapping and return the WireMock response."""
-        resp = requests.post(
+        resp = self._session.post(
             f"{self._admin}/mappings",
-            json=mapping,
+            data=_json_dumps(mapping),
+            headers=_JSON_HEADERS,
             timeout=10,
         )
         resp.raise_for_status()
-        logger.debug("Stub created: %s", resp.json())
-        return resp.json()
+        self.stubs_dirty = True
+        stub: dict[str, Any] = resp.json()
+        logger.debug("Stub created: %s", stub)
+        return stub
 
-    def load_mapping_from_file(self, file_path: str | Path) -> dict[str, Any]:
-        """Read a JSON mapping file and register it as a stub."""
-        path = Path(file_path)
-        with open(path, "r", encoding="utf-8") as fh:
-            mapping: dict[str, Any] = json.load(fh)
-        return self.create_stub(mapping)
+    def create_stubs(self, mappings: list[dict[str, Any]]) -> int:
+        """Register several stub mappings in one request and return how many.
 
-    def load_mappings_from_dir(self, dir_path: str | Path, pattern: str = "*.json") -> int:
-        """Load all mapping files matching *pattern* from a directory.
+        Uses ``POST /__admin/mappings/import``; WireMock versions without that
+        endpoint (404) fall back to one ``create_stub`` call per mapping.
+        """
+        if not mappings:
+            return 0
+        resp = self._session.post(
+            f"{self._admin}/mappings/import",
+            data=_json_dumps({"mappings": mappings}),
+            headers=_JSON_HEADERS,
+            timeout=30,
+        )
+        if resp.status_code == 404:
+            logger.debug("Bulk import unsupported — creating %d stub(s) one by one", len(mappings))
+            for mapping in mappings:
+                self.create_stub(mapping)
+            return len(mappings)
+        resp.raise_for_status()
+        self.stubs_dirty = True
+        logger.debug("Imported %d stub(s)", len(mappings))
+        return len(mappings)
+
+    def load_mapping_from_file(self, file_path: str | os.PathLike[str]) -> dict[str, Any]:
+        """Read a JSON mapping file and register it as a stub.
+
+        The file is read once per process and its bytes are posted as-is
+        (no parse/re-serialize round trip).
+        """
+        resp = self._session.post(
+            f"{self._admin}/mappings",
+            data=_read_mapping_bytes(Path(file_path).resolve()),
+            headers=_JSON_HEADERS,
+            timeout=10,
+        )
+        resp.raise_for_status()
+        self.stubs_dirty = True
+        stub: dict[str, Any] = resp.json()
+        logger.debug("Stub created from %s: %s", file_path, stub)
+        return stub
 
-        Returns the number of mappings loaded.
+    @staticmethod
+    def read_mappings(dir_path: str | Path, pattern: str = "*.json") -> list[dict[str, Any]]:
+        """Parse every mapping file matching *pattern* in a directory (sorted by name).
+
+        Unreadable files are logged and skipped.  Nothing is sent to WireMock,
+        so the result can be kept and registered repeatedly with ``create_stubs``.
         """
-        directory = Path(dir_path)
-        count = 0
-        for file in sorted(directory.glob(pattern)):
+        mappings: list[dict[str, Any]] = []
+        for file in sorted(Path(dir_path).glob(pattern)):
             try:
-                self.load_mapping_from_file(file)
-                count += 1
+                mappings.append(_json_loads(_read_mapping_bytes(file.resolve())))
             except Exception:
                 logger.warning("Failed to load mapping: %s", file, exc_info=True)
-        logger.info("Loaded %d mapping(s) from %s", count, directory)
+        return mappings
+
+    def load_mappings_from_dir(self, dir_path: str | Path, pattern: str = "*.json") -> int:
+        """Load all mapping files matching *pattern* from a directory.
+
+        Files are parsed locally and registered with a single bulk import
+        (see ``create_stubs``).  Returns the number of mappings loaded.
+        """
+        count = self.create_stubs(self.read_mappings(dir_path, pattern))
+        logger.info("Loaded %d mapping(s) from %s", count, dir_path)
         return count
 
     def delete_all_stubs(self) -> None:
         """Remove every stub mapping."""
-        resp = requests.delete(f"{self._admin}/mappings", timeout=10)
+        resp = self._session.delete(f"{self._admin}/mappings", timeout=10)
         resp.raise_for_status()
         logger.info("All stubs deleted.")
 
     def reset(self) -> None:
         """Reset all stubs **and** the request journal."""
-        resp = requests.post(f"{self._admin}/reset", timeout=10)
+        resp = self._session.post(f"{self._admin}/reset", timeout=10)
         resp.raise_for_status()
         logger.info("WireMock reset.")
 
+    # ── Baseline stubs ────────────────────────────────────────────────────
+
+    def push_baseline(self, mappings: list[dict[str, Any]]) -> None:
+        """Register *mappings* and keep them as a new baseline layer.
+
+        Layers survive ``restore_baseline`` until removed with ``pop_baseline``.
+        Registering them does not mark the client dirty.
+        """
+        dirty = self.stubs_dirty
+        self.create_stubs(mappings)
+        self._baseline_layers.append(list(mappings))
+        self.stubs_dirty = dirty
+
+    def pop_baseline(self) -> None:
+        """Drop the most recent baseline layer and restore the remaining ones."""
+        self._baseline_layers.pop()
+        self.restore_baseline()
+
+    def restore_baseline(self) -> None:
+        """Reset WireMock and re-import every baseline layer in one request."""
+        self.reset()
+        self.create_stubs([m for layer in self._baseline_layers for m in layer])
+        self.stubs_dirty = False
+
+    def reset_requests(self) -> None:
+        """Clear only the request journal, leaving stubs in place."""
+        resp = self._session.post(f"{self._admin}/requests/reset", timeout=10)
+        resp.raise_for_status()
+        logger.debug("WireMock request journal cleared.")
+
     # ── Request verification ──────────────────────────────────────────────
 
     def verify_request(
@@ -115,9 +244,10 @@ class WireMockClient:
             "method": method.upper(),
             "url": url,
         }
-        resp = requests.post(
+        resp = self._session.post(
             f"{self._admin}/requests/count",
-            json=payload,
+            data=_json_dumps(payload),
+            headers=_JSON_HEADERS,
             timeout=10,
         )
         resp.raise_for_status()
@@ -130,3 +260,57 @@ class WireMockClient:
             )
 
         return data
+
+    def get_all_requests(self) -> list[dict[str, Any]]:
+        """Return every entry in the request journal (one ``GET`` round trip)."""
+        resp = self._session.get(f"{self._admin}/requests", timeout=10)
+        resp.raise_for_status()
+        journal: list[dict[str, Any]] = _json_loads(resp.content).get("requests", [])
+        return journal
+
+    def verify_requests_bulk(self, specs: list[dict[str, Any]]) -> list[int]:
+        """Check several expected calls against a single journal fetch.
+
+        Parameters
+        ----------
+        specs:
+            One dict per check with either ``url`` (exact match) or
+            ``urlPattern`` (regex, full match — as in a WireMock mapping),
+            optional ``method`` (default ``GET``) and optional
+            ``expected_count`` — the same meaning as the ``verify_request``
+            arguments.
+
+        Returns
+        -------
+        list[int]
+            The actual count for each spec, in order.
+
+        Raises
+        ------
+        AssertionError
+            Listing every spec whose ``expected_count`` did not match.
+        """
+        logged = [
+            (entry.get("request", {}).get("method", "").upper(), entry.get("request", {}).get("url", ""))
+            for entry in self.get_all_requests()
+        ]
+
+        actuals: list[int] = []
+        failures: list[str] = []
+        for spec in specs:
+            method = spec.get("method", "GET").upper()
+            if "urlPattern" in spec:
+                target = spec["urlPattern"]
+                pattern = re.compile(target)
+                actual = sum(1 for m, url in logged if m == method and pattern.fullmatch(url))
+            else:
+                target = spec["url"]
+                actual = sum(1 for m, url in logged if m == method and url == target)
+            actuals.append(actual)
+            expected = spec.get("expected_count")
+            if expected is not None and actual != expected:
+                failures.append(f"Expected {expected} request(s) to {method} {target}, got {actual}")
+
+        if failures:
+            raise AssertionError("; ".join(failures))
+        return actuals
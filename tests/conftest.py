@@ -6,8 +6,10 @@ import logging
 import os
 import shutil
 import subprocess
+from collections.abc import Generator
+from dataclasses import asdict
 from pathlib import Path
-from typing import Generator, List
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import allure
@@ -15,18 +17,29 @@ import pytest
 from _pytest.config.argparsing import Parser
 from _pytest.nodes import Item
 from _pytest.python import Metafunc
+from selenium.common.exceptions import TimeoutException
 
 from src.models.device_info import DeviceInfo
+from src.pages.base_page import flush_screenshots, queue_screenshot_write
+from src.pages.welcome_page import WelcomePage
 from src.utils.app_installer import AppInstaller
 from src.utils.config_loader import ConfigLoader
 from src.utils.device_manager import DeviceManager
 from src.utils.driver_factory import DriverFactory
+from src.utils.waits import wait_for_any_element_present
 from src.utils.wiremock_client import WireMockClient
 
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+
 logger = logging.getLogger(__name__)
 
+# settings.yaml, loaded once in pytest_configure for hooks (which cannot use fixtures).
+_SETTINGS_KEY = pytest.StashKey[dict[str, Any]]()
+
 ALLURE_RESULTS_DIR = Path("allure-results")
 ALLURE_CONFIG_DIR = Path("allure-config")
+_ALLURE_CONFIG_FILES = frozenset({"environment.properties", "categories.json"})
 
 
 # ── CLI options ───────────────────────────────────────────────────────────────
@@ -46,7 +59,7 @@ def pytest_addoption(parser: Parser) -> None:
 # ── Device discovery ──────────────────────────────────────────────────────────
 
 
-def _discover_devices(platform: str) -> List[DeviceInfo]:
+def _discover_devices(platform: str) -> list[DeviceInfo]:
     """Discover devices based on the --platform flag."""
     if platform == "android":
         devices = DeviceManager.discover_android()
@@ -71,16 +84,35 @@ def _discover_devices(platform: str) -> List[DeviceInfo]:
 
 
 # Cache discovered devices for the session (avoid re-running adb/xcrun per test)
-_cached_devices: List[DeviceInfo] | None = None
+_cached_devices: list[DeviceInfo] | None = None
+
+# ``workerinput`` key under which the xdist controller hands devices to workers.
+_WORKER_DEVICES_KEY = "remita_devices"
 
 
-def _get_devices(platform: str) -> List[DeviceInfo]:
+def _get_devices(config: pytest.Config) -> list[DeviceInfo]:
+    """Return the session's devices, discovering them at most once.
+
+    Under pytest-xdist the controller discovers devices once and ships them
+    to every worker (see ``pytest_configure_node``), so workers never run
+    ``adb``/``xcrun`` themselves.
+    """
     global _cached_devices
     if _cached_devices is None:
-        _cached_devices = _discover_devices(platform)
+        worker_input = getattr(config, "workerinput", {})
+        if _WORKER_DEVICES_KEY in worker_input:
+            _cached_devices = [DeviceInfo(**d) for d in worker_input[_WORKER_DEVICES_KEY]]
+        else:
+            _cached_devices = _discover_devices(config.getoption("--platform"))
     return _cached_devices
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:  # type: ignore[no-untyped-def]
+    """(xdist controller) Discover devices once and pass them to each worker."""
+    node.workerinput[_WORKER_DEVICES_KEY] = [asdict(d) for d in _get_devices(node.config)]
+
+
 # ── Dynamic parametrization ───────────────────────────────────────────────────
 
 
@@ -89,14 +121,20 @@ def pytest_generate_tests(metafunc: Metafunc) -> None:
 
     Every test that requests ``device_info`` will be run once per
     discovered device. Tests that don't request it run normally.
+
+    Each device is tagged with an ``xdist_group`` so that, under
+    ``pytest -n <devices> --dist loadgroup``, all tests for one device stay
+    on one worker (sharing its session-scoped driver) while different
+    devices run in parallel.
     """
     if "device_info" in metafunc.fixturenames:
-        platform = metafunc.config.getoption("--platform")
-        devices = _get_devices(platform)
+        devices = _get_devices(metafunc.config)
         metafunc.parametrize(
             "device_info",
-            devices,
-            ids=[d.allure_label for d in devices],
+            [
+                pytest.param(d, id=d.allure_label, marks=pytest.mark.xdist_group(d.allure_label))
+                for d in devices
+            ],
             scope="session",
         )
 
@@ -111,7 +149,13 @@ def platform(request: pytest.FixtureRequest) -> str:
 
 
 @pytest.fixture(scope="session")
-def driver(device_info: DeviceInfo) -> Generator:
+def settings(pytestconfig: pytest.Config) -> dict[str, Any]:
+    """Return ``settings.yaml`` as loaded once in ``pytest_configure`` (read-only)."""
+    return pytestconfig.stash[_SETTINGS_KEY]
+
+
+@pytest.fixture(scope="session")
+def driver(device_info: DeviceInfo, pytestconfig: pytest.Config) -> Generator[WebDriver, None, None]:
     """Create an Appium driver for a specific device, quit it afterwards.
 
     Before creating the driver, checks if the app is installed on the device.
@@ -135,7 +179,10 @@ def driver(device_info: DeviceInfo) -> Generator:
                 f"Check that the APK/IPA exists at: {app_path}"
             )
 
-    _driver = DriverFactory.get_driver_for_device(device_info)
+    # Offset Appium's per-session ports by the device's position so drivers for
+    # different devices (e.g. on parallel xdist workers) never share a port.
+    port_offset = _get_devices(pytestconfig).index(device_info)
+    _driver = DriverFactory.get_driver_for_device(device_info, port_offset)
     logger.info(
         "Driver ready for %s (session=%s)",
         device_info.display_name, _driver.session_id,
@@ -151,18 +198,41 @@ def driver(device_info: DeviceInfo) -> Generator:
     _driver.quit()
 
 
+def _worker_index() -> int:
+    """Return the pytest-xdist worker number (``gw3`` → 3), or 0 without xdist."""
+    return int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").removeprefix("gw") or 0)
+
+
+def _wiremock_ports(settings: dict[str, Any]) -> tuple[int, int]:
+    """Return ``(app_port, host_port)`` for this worker's WireMock instance.
+
+    The app always talks to ``wiremock.base_url``'s port on the device.  With
+    ``wiremock.port_per_worker`` enabled, each xdist worker uses its own
+    WireMock on the host at ``base port + worker number`` so one worker's
+    stub resets can't clobber another's.
+    """
+    wm_settings = settings.get("wiremock", {})
+    app_port = urlparse(wm_settings.get("base_url", "http://localhost:8080")).port or 8080
+    offset = _worker_index() if wm_settings.get("port_per_worker", False) else 0
+    return app_port, app_port + offset
+
+
 @pytest.fixture(scope="session")
-def wiremock() -> Generator[WireMockClient, None, None]:
-    """Provide a ``WireMockClient`` for the session."""
-    settings = ConfigLoader.load_settings()
+def wiremock(settings: dict[str, Any]) -> Generator[WireMockClient, None, None]:
+    """Provide a ``WireMockClient`` for the session (this worker's instance)."""
     base_url: str = settings.get("wiremock", {}).get("base_url", "http://localhost:8080")
+    app_port, host_port = _wiremock_ports(settings)
+    if host_port != app_port:
+        parsed = urlparse(base_url)
+        base_url = parsed._replace(netloc=f"{parsed.hostname}:{host_port}").geturl()
     client = WireMockClient(base_url)
     logger.info("WireMockClient connected → %s (healthy=%s)", base_url, client.is_healthy())
     yield client
+    client.close()
 
 
 @pytest.fixture(scope="session", autouse=True)
-def _setup_adb_reverse(device_info: DeviceInfo, driver) -> Generator[None, None, None]:
+def _setup_adb_reverse(device_info: DeviceInfo, driver: WebDriver, settings: dict[str, Any]) -> Generator[None, None, None]:
     """Set up adb reverse port forwarding after Appium driver is created.
 
     Appium's UiAutomator2 driver may restart the ADB server during session
@@ -171,17 +241,15 @@ def _setup_adb_reverse(device_info: DeviceInfo, driver) -> Generator[None, None,
     app can reach WireMock on the host.
     """
     if device_info.platform == "android":
-        settings = ConfigLoader.load_settings()
-        wiremock_url = settings.get("wiremock", {}).get("base_url", "http://localhost:8080")
-        port = urlparse(wiremock_url).port or 8080
+        app_port, host_port = _wiremock_ports(settings)
 
         try:
             result = subprocess.run(
-                ["adb", "-s", device_info.serial, "reverse", f"tcp:{port}", f"tcp:{port}"],
+                ["adb", "-s", device_info.serial, "reverse", f"tcp:{app_port}", f"tcp:{host_port}"],
                 capture_output=True, text=True, timeout=10,
             )
             if result.returncode == 0:
-                logger.info("✅ adb reverse tcp:%s → tcp:%s on %s", port, port, device_info.serial)
+                logger.info("✅ adb reverse tcp:%s → tcp:%s on %s", app_port, host_port, device_info.serial)
             else:
                 logger.warning("⚠️ adb reverse failed: %s", result.stderr.strip())
         except Exception:
@@ -190,21 +258,52 @@ def _setup_adb_reverse(device_info: DeviceInfo, driver) -> Generator[None, None,
     yield
 
 
+# Upper bound for the relaunched app to get past its splash screen.
+_APP_READY_TIMEOUT = 8
+
+
+def _wait_for_app_ready(driver: WebDriver) -> None:
+    """Block until the relaunched app shows its first post-splash screen.
+
+    Once the splash has finished its init API calls the app lands on the
+    welcome screen, possibly behind an announcement dialog, so wait for
+    either one.  Fails the test if neither appears in time.
+    """
+    try:
+        wait_for_any_element_present(
+            driver, [WelcomePage.VISITOR_CONTAINER, WelcomePage.DIALOG_CARD], timeout=_APP_READY_TIMEOUT,
+        )
+    except TimeoutException:
+        pytest.fail(
+            f"App showed neither the welcome screen nor a startup dialog "
+            f"within {_APP_READY_TIMEOUT}s of relaunch"
+        )
+
+
 @pytest.fixture(autouse=True)
-def _reset_app_state(driver) -> Generator[None, None, None]:
+def _reset_app_state(driver: WebDriver) -> Generator[None, None, None]:
     """Reset the app to a clean state before each test.
 
-    Restarts the app and waits for splash + init API calls to complete.
+    Restarts the app; on Android also waits for the splash + init API calls
+    to hand over to the welcome screen.  On iOS ``activate_app`` only returns once
+    the app is in the foreground, so there is nothing further to wait for.
     Dialog dismissal is handled by each test's page objects since
     different flows may need different handling.
     """
-    # Force implicit wait to 0 for faster element lookups
-    driver.implicitly_wait(0)
-    
-    driver.terminate_app(driver.capabilities.get("appPackage", ""))
-    driver.activate_app(driver.capabilities.get("appPackage", ""))
-    import time
-    time.sleep(3)  # Wait for splash + init API calls to complete
+    caps = driver.capabilities
+    app_id = caps.get("appPackage") or caps.get("bundleId", "")
+    activity = caps.get("appActivity")
+    if caps.get("platformName", "").lower() == "android" and activity:
+        # One `am start -S` call force-stops and relaunches the app, replacing
+        # the terminate_app + activate_app pair (two round-trips).
+        driver.execute_script(
+            "mobile: startActivity",
+            {"intent": f"{app_id}/{activity}", "stop": True, "wait": True},
+        )
+        _wait_for_app_ready(driver)
+    else:
+        driver.terminate_app(app_id)
+        driver.activate_app(app_id)
     yield
 
 
@@ -212,38 +311,49 @@ def _reset_app_state(driver) -> Generator[None, None, None]:
 _WIREMOCK_MAPPINGS_DIR = Path("wiremock/mappings")
 
 
-def _load_init_stubs(client: WireMockClient) -> None:
-    """Reload the app init stubs and catch-all that WireMock needs.
-
-    These stubs are required for the app to survive its splash-screen
-    startup API calls (public key, customer service, etc.).
+@pytest.fixture(scope="session", autouse=True)
+def _init_stubs(wiremock: WireMockClient) -> None:
+    """Parse the app init stubs once and register them as the session baseline.
+
+    These stubs (``app_*.json`` — public key, customer service, catch-all,
+    etc.) are required for the app to survive its splash-screen startup
+    API calls.  WireMock is reset first so stubs left by a previous run
+    don't pile up.  They form the bottom baseline layer, which
+    ``restore_baseline`` re-imports after a full reset without touching the
+    disk again; test classes may push further layers for their duration
+    (see ``TestRegister``).
+
+    Session-scoped autouse, so it runs before the first per-test app relaunch.
     """
-    for f in sorted(_WIREMOCK_MAPPINGS_DIR.glob("app_*.json")):
-        try:
-            client.load_mapping_from_file(f)
-        except Exception:
-            logger.warning("Failed to load init stub: %s", f, exc_info=True)
+    mappings = WireMockClient.read_mappings(_WIREMOCK_MAPPINGS_DIR, "app_*.json")
+    try:
+        wiremock.reset()
+        wiremock.push_baseline(mappings)
+    except Exception:
+        logger.warning("Failed to load WireMock init stubs", exc_info=True)
 
 
 @pytest.fixture(autouse=True)
-def _reset_wiremock(wiremock: WireMockClient) -> Generator[None, None, None]:
+def _reset_wiremock(
+    request: pytest.FixtureRequest, wiremock: WireMockClient, _init_stubs: None
+) -> Generator[None, None, None]:
     """Auto-use fixture that manages WireMock stubs for each test.
 
-    Before: Load init stubs (without full reset to preserve request journal for debugging).
-    After: Reset stubs for clean state.
+    Before: nothing — the baseline stubs are already registered
+    (``_init_stubs``) and the request journal is kept for debugging.
+    After: Tests that registered stubs through the client (``stubs_dirty``),
+    or are marked ``@pytest.mark.wiremock_mutates_stubs`` because they change
+    stubs some other way, get a full reset and the baseline re-imported in
+    one request; all other tests only have the request journal cleared.
     """
-    # BEFORE test: ensure init stubs are loaded (don't reset to preserve journal)
-    try:
-        _load_init_stubs(wiremock)
-    except Exception:
-        logger.warning("Failed to setup WireMock before test", exc_info=True)
-    
     yield
-    
+
     # AFTER test: reset for clean state
     try:
-        wiremock.reset()
-        _load_init_stubs(wiremock)
+        if wiremock.stubs_dirty or request.node.get_closest_marker("wiremock_mutates_stubs"):
+            wiremock.restore_baseline()
+        else:
+            wiremock.reset_requests()
     except Exception:
         logger.warning("Failed to reset WireMock after test", exc_info=True)
 
@@ -251,6 +361,14 @@ def _reset_wiremock(wiremock: WireMockClient) -> Generator[None, None, None]:
 # ── Hooks ─────────────────────────────────────────────────────────────────────
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Load settings for hooks and fixtures, and create the failure-screenshot directory."""
+    config.stash[_SETTINGS_KEY] = ConfigLoader.load_settings()
+    screenshots = config.stash[_SETTINGS_KEY].get("screenshots", {})
+    if screenshots.get("on_failure", True):
+        os.makedirs(screenshots.get("output_dir", "reports/screenshots"), exist_ok=True)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item: Item) -> Generator:  # type: ignore[type-arg]
     """Take a screenshot on test failure and attach it to Allure report."""
@@ -258,7 +376,7 @@ def pytest_runtest_makereport(item: Item) -> Generator:  # type: ignore[type-arg
     report = outcome.get_result()
 
     if report.when == "call" and report.failed:
-        settings = ConfigLoader.load_settings()
+        settings = item.config.stash[_SETTINGS_KEY]
         if not settings.get("screenshots", {}).get("on_failure", True):
             return
 
@@ -267,32 +385,47 @@ def pytest_runtest_makereport(item: Item) -> Generator:  # type: ignore[type-arg
             return
 
         screenshot_dir = settings.get("screenshots", {}).get("output_dir", "reports/screenshots")
-        os.makedirs(screenshot_dir, exist_ok=True)
 
         file_name = f"{item.nodeid.replace('::', '_').replace('/', '_')}.png"
         file_path = os.path.join(screenshot_dir, file_name)
 
         try:
-            driver.save_screenshot(file_path)
-            logger.info("Screenshot saved → %s", file_path)
-
-            # Attach screenshot to Allure report
-            with open(file_path, "rb") as f:
-                allure.attach(
-                    f.read(),
-                    name=f"failure_{file_name}",
-                    attachment_type=allure.attachment_type.PNG,
-                )
+            png = driver.get_screenshot_as_png()
+
+            # Attach the in-memory PNG; the disk copy is written in the background
+            # (flushed in pytest_sessionfinish).
+            allure.attach(
+                png,
+                name=f"failure_{file_name}",
+                attachment_type=allure.attachment_type.PNG,
+            )
+            queue_screenshot_write(file_path, png)
         except Exception:
             logger.warning("Failed to take screenshot for %s", item.nodeid, exc_info=True)
 
 
+def _copy_if_newer(src: os.DirEntry[str], dst: Path) -> None:
+    """Copy *src* to *dst* unless *dst* already exists and is at least as new."""
+    try:
+        if dst.stat().st_mtime >= src.stat().st_mtime:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(src.path, dst)
+
+
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
-    """Copy Allure environment and categories config into results dir."""
+    """Flush pending screenshots and copy Allure config into results dir."""
+    flush_screenshots()
+
     if not ALLURE_RESULTS_DIR.exists():
         return
 
-    for filename in ("environment.properties", "categories.json"):
-        src = ALLURE_CONFIG_DIR / filename
-        if src.exists():
-            shutil.copy(str(src), str(ALLURE_RESULTS_DIR / filename))
+    # One directory scan instead of a stat per file; copyfile skips metadata allure never reads.
+    try:
+        with os.scandir(ALLURE_CONFIG_DIR) as entries:
+            for entry in entries:
+                if entry.name in _ALLURE_CONFIG_FILES and entry.is_file():
+                    _copy_if_newer(entry, ALLURE_RESULTS_DIR / entry.name)
+    except FileNotFoundError:
+        pass
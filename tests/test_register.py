@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 import allure
@@ -13,12 +14,11 @@ from src.pages.register_success_page import RegisterSuccessPage
 from src.pages.register_verify_email_page import RegisterVerifyEmailPage
 from src.pages.register_verify_phone_page import RegisterVerifyPhonePage
 from src.pages.welcome_page import WelcomePage
+from src.utils.wiremock_client import WireMockClient
 
 if TYPE_CHECKING:
     from appium.webdriver.webdriver import WebDriver
 
-    from src.utils.wiremock_client import WireMockClient
-
 # ── Test data ─────────────────────────────────────────────────────────────────
 
 PHONE = "987123789"
@@ -26,13 +26,10 @@ OTP = "123456"
 EMAIL = "test@gmail.com"
 PASSWORD = "Test@1234"
 
-# ── WireMock mapping paths ────────────────────────────────────────────────────
+# ── WireMock mappings ─────────────────────────────────────────────────────────
 
-_STUB_SEND_PHONE_OTP = "wiremock/mappings/register/register_send_phone_otp.json"
-_STUB_VERIFY_PHONE_OTP = "wiremock/mappings/register/register_verify_phone_otp.json"
-_STUB_SEND_EMAIL_OTP = "wiremock/mappings/register/register_send_email_otp.json"
-_STUB_VERIFY_EMAIL_OTP = "wiremock/mappings/register/register_verify_email_otp.json"
-_STUB_CREATE_PASSWORD = "wiremock/mappings/register/register_create_password.json"
+# One stub per registration endpoint; none overlap, so all are loaded up front.
+_REGISTER_STUBS_DIR = "wiremock/mappings/register"
 
 
 @allure.epic("Registration")
@@ -40,24 +37,25 @@ _STUB_CREATE_PASSWORD = "wiremock/mappings/register/register_create_password.jso
 class TestRegister:
     """Tests for the user registration flow."""
 
-    @pytest.mark.smoke
-    @pytest.mark.regression
-    @allure.story("Successful Registration")
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.title("Complete registration happy path")
-    @allure.description(
-        "Verify the full registration flow: phone verification → phone OTP → "
-        "email verification → email OTP → create password → success screen."
-    )
-    def test_successful_registration(self, driver: WebDriver, wiremock: WireMockClient) -> None:
-        """A new user should be able to register and reach the success screen."""
-        with allure.step("Set up WireMock stubs for the full registration flow"):
-            wiremock.load_mapping_from_file(_STUB_SEND_PHONE_OTP)
-            wiremock.load_mapping_from_file(_STUB_VERIFY_PHONE_OTP)
-            wiremock.load_mapping_from_file(_STUB_SEND_EMAIL_OTP)
-            wiremock.load_mapping_from_file(_STUB_VERIFY_EMAIL_OTP)
-            wiremock.load_mapping_from_file(_STUB_CREATE_PASSWORD)
-
+    @pytest.fixture(scope="class", autouse=True)
+    def _register_stubs(self, wiremock: WireMockClient) -> Generator[None, None, None]:
+        """Register every registration stub once for the whole class.
+
+        The mappings are pushed as a baseline layer, so ``_reset_wiremock``
+        restores them after any test that dirties WireMock; the layer is
+        popped once the class is done.
+        """
+        wiremock.push_baseline(WireMockClient.read_mappings(_REGISTER_STUBS_DIR))
+        yield
+        wiremock.pop_baseline()
+
+    @pytest.fixture
+    def at_verify_phone(self, driver: WebDriver) -> RegisterVerifyPhonePage:
+        """Walk welcome → intro → T&C and return the Verify Phone page.
+
+        Function-scoped: ``_reset_app_state`` relaunches the app before every
+        test, so each test needs its own walk to the first registration screen.
+        """
         welcome_page = WelcomePage(driver)
 
         with allure.step("Dismiss startup announcement dialogs"):
@@ -67,38 +65,63 @@ class TestRegister:
             assert welcome_page.is_page_displayed(), "Welcome screen did not appear"
             welcome_page.navigate_to_registration()
 
-        verify_phone_page = RegisterVerifyPhonePage(driver)
+        return RegisterVerifyPhonePage(driver)
+
+    @pytest.mark.smoke
+    @pytest.mark.regression
+    @allure.story("Phone OTP Sent", "Email Verification Displayed", "Successful Registration")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.title("Complete registration happy path")
+    @allure.description(
+        "Verify the full registration flow: phone verification → phone OTP → "
+        "email verification → email OTP → create password → success screen. "
+        "The phone OTP and email verification screens are checked on the way."
+    )
+    def test_successful_registration(self, driver: WebDriver, at_verify_phone: RegisterVerifyPhonePage) -> None:
+        """A new user should be able to register and reach the success screen.
+
+        The flow is walked once; the phone OTP and email verification screens
+        are asserted as checkpoints instead of re-running the same prefix in
+        separate tests.  Other screens are only reached through their actions,
+        which wait for their own elements.
+        """
+        verify_phone_page = at_verify_phone
 
         with allure.step(f"Enter phone number '{PHONE}' and tap Next"):
-            assert verify_phone_page.is_page_displayed(), "Verify phone screen did not appear"
             verify_phone_page.enter_phone_number(PHONE)
             verify_phone_page.tap_next()
 
         phone_otp_page = RegisterOtpPage(driver)
 
+        with allure.step("Verify phone OTP screen is displayed"):
+            assert phone_otp_page.is_page_displayed(), (
+                "Phone OTP screen did not appear after submitting phone number"
+            )
+
         with allure.step("Enter phone OTP and tap Verify"):
-            assert phone_otp_page.is_page_displayed(), "Phone OTP screen did not appear"
             phone_otp_page.enter_otp(OTP)
             phone_otp_page.tap_verify()
 
         verify_email_page = RegisterVerifyEmailPage(driver)
 
+        with allure.step("Verify email verification screen is displayed"):
+            assert verify_email_page.is_page_displayed(), (
+                "Email verification screen did not appear after phone OTP verification"
+            )
+
         with allure.step(f"Enter email '{EMAIL}' and tap Next"):
-            assert verify_email_page.is_page_displayed(), "Verify email screen did not appear"
             verify_email_page.enter_email(EMAIL)
             verify_email_page.tap_next()
 
         email_otp_page = RegisterOtpPage(driver)
 
         with allure.step("Enter email OTP and tap Verify"):
-            assert email_otp_page.is_page_displayed(), "Email OTP screen did not appear"
             email_otp_page.enter_otp(OTP)
             email_otp_page.tap_verify()
 
         create_password_page = RegisterCreatePasswordPage(driver)
 
         with allure.step("Enter password and tap Next"):
-            assert create_password_page.is_page_displayed(), "Create password screen did not appear"
             create_password_page.enter_password(PASSWORD)
             create_password_page.tap_next()
 
@@ -110,81 +133,3 @@ class TestRegister:
         with allure.step("Verify success title contains 'Hooray!'"):
             title = success_page.get_title()
             assert "Hooray" in title, f"Expected 'Hooray!' in title, got: '{title}'"
-
-    @pytest.mark.regression
-    @allure.story("Phone OTP Sent")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.title("Phone OTP screen appears after submitting phone number")
-    @allure.description(
-        "Verify that after entering a phone number and tapping Next, "
-        "the OTP verification screen is displayed."
-    )
-    def test_register_phone_otp_sent(self, driver: WebDriver, wiremock: WireMockClient) -> None:
-        """Submitting a phone number should navigate to the OTP screen."""
-        with allure.step("Set up WireMock stub for sending phone OTP"):
-            wiremock.load_mapping_from_file(_STUB_SEND_PHONE_OTP)
-
-        welcome_page = WelcomePage(driver)
-
-        with allure.step("Dismiss startup announcement dialogs"):
-            welcome_page.dismiss_startup_dialogs()
-
-        with allure.step("Navigate through welcome → intro → T&C to registration"):
-            assert welcome_page.is_page_displayed(), "Welcome screen did not appear"
-            welcome_page.navigate_to_registration()
-
-        verify_phone_page = RegisterVerifyPhonePage(driver)
-
-        with allure.step(f"Enter phone number '{PHONE}' and tap Next"):
-            assert verify_phone_page.is_page_displayed(), "Verify phone screen did not appear"
-            verify_phone_page.enter_phone_number(PHONE)
-            verify_phone_page.tap_next()
-
-        otp_page = RegisterOtpPage(driver)
-
-        with allure.step("Verify OTP screen is displayed"):
-            assert otp_page.is_page_displayed(), "Phone OTP screen did not appear after submitting phone number"
-
-    @pytest.mark.regression
-    @allure.story("Email Verification Displayed")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.title("Email verification screen appears after phone OTP verification")
-    @allure.description(
-        "Verify that after completing phone verification, "
-        "the email verification screen is displayed."
-    )
-    def test_register_verify_email_displayed(self, driver: WebDriver, wiremock: WireMockClient) -> None:
-        """After phone OTP verification, the email verification screen should appear."""
-        with allure.step("Set up WireMock stubs for phone verification"):
-            wiremock.load_mapping_from_file(_STUB_SEND_PHONE_OTP)
-            wiremock.load_mapping_from_file(_STUB_VERIFY_PHONE_OTP)
-
-        welcome_page = WelcomePage(driver)
-
-        with allure.step("Dismiss startup announcement dialogs"):
-            welcome_page.dismiss_startup_dialogs()
-
-        with allure.step("Navigate through welcome → intro → T&C to registration"):
-            assert welcome_page.is_page_displayed(), "Welcome screen did not appear"
-            welcome_page.navigate_to_registration()
-
-        verify_phone_page = RegisterVerifyPhonePage(driver)
-
-        with allure.step(f"Enter phone number '{PHONE}' and tap Next"):
-            assert verify_phone_page.is_page_displayed(), "Verify phone screen did not appear"
-            verify_phone_page.enter_phone_number(PHONE)
-            verify_phone_page.tap_next()
-
-        otp_page = RegisterOtpPage(driver)
-
-        with allure.step("Enter phone OTP and tap Verify"):
-            assert otp_page.is_page_displayed(), "Phone OTP screen did not appear"
-            otp_page.enter_otp(OTP)
-            otp_page.tap_verify()
-
-        verify_email_page = RegisterVerifyEmailPage(driver)
-
-        with allure.step("Verify email verification screen is displayed"):
-            assert verify_email_page.is_page_displayed(), (
-                "Email verification screen did not appear after phone OTP verification"
-            )